@@ -0,0 +1 @@
+"""Shared launcher for the Python MCP servers in this repository."""
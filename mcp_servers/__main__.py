@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Shared entry point: `python -m mcp_servers <name>` from the repository root.
+
+Each server keeps its modules at the top level of its own directory (`server`, `utils`), so the
+chosen server directory is put on the Python path and its `server` module imported once.
+"""
+import importlib
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SERVERS = {
+    "template": ("template", "MCP Template Server"),
+    "todo": ("todo_server", "Task Management Server"),
+}
+
+def run(name: str) -> None:
+    """Import the named server's `server` module and run its MCP instance."""
+    directory, label = SERVERS[name]
+    sys.path.insert(0, os.path.join(ROOT, directory))
+    mcp = importlib.import_module("server").mcp
+    # stdout carries the MCP protocol, so status messages go to stderr
+    print(f"Starting {label}...", file=sys.stderr)
+    try:
+        mcp.run()
+    except Exception as e:
+        print(f"Error starting {label}: {e}", file=sys.stderr)
+        raise
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in SERVERS:
+        print(f"Usage: python -m mcp_servers {{{','.join(SERVERS)}}}", file=sys.stderr)
+        sys.exit(2)
+    run(sys.argv[1])
@@ -1,9 +1,11 @@
-# Entry point for the MCP server template
+# Entry point for the MCP server template (also available as `python -m mcp_servers template`)
+import sys
+
 from server import mcp
 
 if __name__ == "__main__":
-    print("Starting MCP Template Server...")
+    print("Starting MCP Template Server...", file=sys.stderr)
     try:
         mcp.run()
     except Exception as e:
-        print(f"Error starting MCP Template Server: {e}")
+        print(f"Error starting MCP Template Server: {e}", file=sys.stderr)
@@ -1,11 +1,21 @@
 # Template MCP server setup
+import atexit
 import logging
+import logging.handlers
+import queue
 from mcp.server.fastmcp import FastMCP
 
 from utils.example_utils import example_utility_function
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s %(message)s')
+# Configure logging: tool handlers only enqueue records, a background listener does the stream I/O
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream, respect_handler_level=True)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("template_server")
 
 # Create the MCP server instance
@@ -19,7 +29,7 @@ def echo(param: str) -> dict:
     Example Echo tool for the MCP server template.
     Replace or extend this with your own tools.
     """
-    logger.info(f"example_tool called with param: {param}")
+    logger.info("example_tool called with param: %s", param)
     result = example_utility_function(param)
     return {"message": f"You sent: {result}"}
 
@@ -1,9 +1,12 @@
+# Entry point for the task server (also available as `python -m mcp_servers todo`)
+import sys
+
 from server import mcp
 
 if __name__ == "__main__":
     # The task resources and tools are already registered in server.py
-    print("Starting Task Management Server...")
+    print("Starting Task Management Server...", file=sys.stderr)
     try:
         mcp.run()
     except Exception as e:
-        print(f"Error starting Task Management Server: {e}")
\ No newline at end of file
+        print(f"Error starting Task Management Server: {e}", file=sys.stderr)
\ No newline at end of file
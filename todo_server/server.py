@@ -1,350 +1,550 @@
+import asyncio
+import atexit
+import functools
+import importlib
+import inspect
 import logging
-from mcp.server.fastmcp import FastMCP
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
-from utils.task_manager import (
-    get_tasks as tm_task_list,
-    add_task as tm_task_create,
-    toggle_task as tm_task_toggle_completion,
-    delete_task as tm_task_delete,
-    get_subtree as tm_task_get_with_subtasks,
-    update_subtree as tm_task_update,
-    move_subtree as tm_task_move,
-    create_context as tm_context_create,
-    delete_context as tm_context_delete,
-    get_contexts as tm_context_list,
-)
-
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s %(message)s')
+from mcp.server.fastmcp.resources import FunctionResource
+from utils.cached_fastmcp import CachedFastMCP
+
+# The task store (SQLAlchemy and the ORM models, ~200ms to import) is imported on the first
+# tool call rather than at startup, so the server can answer initialize and tools/list right away
+@functools.lru_cache(maxsize=None)
+def _tm(name: str) -> Any:
+    return getattr(importlib.import_module("utils.task_manager"), name)
+
+def _lazy(name: str):
+    def call(*args):
+        return _tm(name)(*args)
+    call.__name__ = name
+    return call
+
+tm_task_list = _lazy("get_tasks")
+tm_task_create_bulk = _lazy("add_tasks_bulk")
+tm_task_toggle_completion = _lazy("toggle_task")
+tm_task_delete = _lazy("delete_task")
+tm_task_get_with_subtasks = _lazy("get_subtree")
+tm_task_update = _lazy("update_subtree")
+tm_task_move = _lazy("move_subtree")
+tm_context_create = _lazy("create_context")
+tm_context_delete = _lazy("delete_context")
+tm_context_list = _lazy("get_contexts")
+
+# Configure logging: tool handlers only enqueue records, a background listener does the stream I/O
+_LOG_QUEUE_SIZE = 65536
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking or erroring when the queue is full."""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+_log_queue: queue.Queue = queue.Queue(_LOG_QUEUE_SIZE)
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s %(message)s'))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream, respect_handler_level=True)
+logging.getLogger().addHandler(_DroppingQueueHandler(_log_queue))
+# FastMCP logs every request at INFO, so stay at WARNING unless DEBUG is set (which also adds tracebacks)
+logging.getLogger().setLevel(logging.DEBUG if os.environ.get('DEBUG') else logging.WARNING)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("task_server")
 
-mcp = FastMCP("task_server")
+mcp = CachedFastMCP("task_server")
+
+def _log_error(msg: str, e: BaseException) -> None:
+    """Log a tool failure without formatting a traceback unless DEBUG is enabled."""
+    logger.error("%s: %s", msg, e)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s traceback", msg, exc_info=e)
+
+def _safe_tool(on_error):
+    """Turn an exception escaping a tool into a logged on_error(exception) result."""
+    def decorator(fn):
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    _log_error(f"Error in {fn.__name__}", e)
+                    return on_error(e)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                _log_error(f"Error in {fn.__name__}", e)
+                return on_error(e)
+        return wrapper
+    return decorator
+
+# Single-object tools report failures as {"error": ...}; list tools fall back to an empty list
+_safe = _safe_tool(lambda e: {"error": str(e)})
+_safe_list = _safe_tool(lambda e: [])
+
+# Read cache: entries are tagged with the state version they were computed at, and every
+# successful mutation bumps the version, so stale entries are simply never hit again.
+# Writes made by another process sharing the database can't bump the version, so entries
+# also expire after a short TTL.
+_READ_CACHE: "OrderedDict[tuple, tuple[int, float, Any]]" = OrderedDict()
+_READ_CACHE_SIZE = 256
+_READ_CACHE_TTL = 2.0
+_READ_CACHE_LOCK = threading.Lock()
+_STATE_VERSION = 0
+_MISSING = object()
+# Keys that capacity eviction skips (they still go stale on writes like any other entry);
+# the context listing and the default context's tasks are read on nearly every call
+_ALWAYS_PINNED = frozenset({("_context_list", ()), ("_task_list", (None,)), ("_task_list", ("default",))})
+_PINNED_KEYS = set(_ALWAYS_PINNED)
+# Contexts cache_pin may add, kept well below _READ_CACHE_SIZE so eviction always finds an unpinned entry
+_MAX_PINNED_CONTEXTS = 16
+
+def _evict_one() -> None:
+    """Drop the least recently used unpinned entry. Caller holds _READ_CACHE_LOCK."""
+    for key in _READ_CACHE:
+        if key not in _PINNED_KEYS:
+            del _READ_CACHE[key]
+            return
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, dict) and "error" in result
+
+def _record_write(result: Any) -> Any:
+    """Invalidate cached reads if a mutation succeeded."""
+    global _STATE_VERSION
+    if not _is_error(result):
+        _STATE_VERSION += 1
+    return result
+
+def cached_read(fn):
+    """
+    Memoize a read keyed on its arguments until the next successful mutation.
+    wrapper.peek(*args) returns the cached result without calling fn, or _MISSING.
+    """
+    def peek(*args):
+        key = (fn.__name__, args)
+        with _READ_CACHE_LOCK:
+            hit = _READ_CACHE.get(key)
+            if hit is not None and hit[0] == _STATE_VERSION and time.monotonic() - hit[1] < _READ_CACHE_TTL:
+                _READ_CACHE.move_to_end(key)
+                return hit[2]
+        return _MISSING
+
+    @functools.wraps(fn)
+    def wrapper(*args):
+        result = peek(*args)
+        if result is not _MISSING:
+            return result
+        key = (fn.__name__, args)
+        version, started = _STATE_VERSION, time.monotonic()
+        result = fn(*args)
+        if not _is_error(result):
+            with _READ_CACHE_LOCK:
+                _READ_CACHE[key] = (version, started, result)
+                _READ_CACHE.move_to_end(key)
+                if len(_READ_CACHE) > _READ_CACHE_SIZE:
+                    _evict_one()
+        return result
+    wrapper.peek = peek
+    return wrapper
+
+# Worker pool for task store reads. TASK_SERVER_WORKERS can shrink the pool on small machines.
+_WORKERS = int(os.environ.get('TASK_SERVER_WORKERS') or min(32, (os.cpu_count() or 1) * 4))
+_EXECUTOR = ThreadPoolExecutor(max_workers=_WORKERS, thread_name_prefix="task_batch")
+# Mutations all go through one writer thread. SQLite only admits one writer at a time, and
+# concurrent writers otherwise wait out SQLITE_BUSY in the driver's sleep-and-retry loop;
+# in WAL mode reads on the pool keep running alongside the writer.
+_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="task_writer")
+
+async def _in_executor(fn, *args) -> Any:
+    """Run a blocking task store call on the worker pool so the event loop keeps reading requests."""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, fn, *args)
+
+async def _in_writer(fn, *args) -> Any:
+    """Run a task store mutation on the writer thread."""
+    return await asyncio.get_running_loop().run_in_executor(_WRITER, fn, *args)
+
+# Reads currently running on the worker pool, keyed on the state version they started at so a
+# caller never joins a read that began before a write it has already seen complete
+_INFLIGHT: Dict[tuple, asyncio.Future] = {}
+
+async def _read(fn, *args) -> Any:
+    """
+    Serve a cached read straight from the event loop; on a miss, share one worker-pool call
+    between every caller asking for the same read while it is in flight.
+    """
+    result = fn.peek(*args)
+    if result is not _MISSING:
+        return result
+    key = (fn, args, _STATE_VERSION)
+    inflight = _INFLIGHT.get(key)
+    if inflight is None:
+        inflight = asyncio.ensure_future(_in_executor(fn, *args))
+        _INFLIGHT[key] = inflight
+        inflight.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    return await asyncio.shield(inflight)
+
+def _compile_adapter(fn):
+    """Precompute how a batch item dict maps onto fn's positional parameters."""
+    params = list(inspect.signature(fn).parameters.values())
+    names = tuple(p.name for p in params)
+    defaults = tuple(None if p.default is inspect.Parameter.empty else p.default for p in params)
+    known = frozenset(names)
+    required = frozenset(p.name for p in params if p.default is inspect.Parameter.empty)
+
+    def adapt(item: Dict[str, Any]) -> List[Any]:
+        if not known.issuperset(item):
+            raise ValueError(f"Unknown field(s): {', '.join(sorted(item.keys() - known))}")
+        if not required.issubset(item):
+            raise ValueError(f"Missing required field(s): {', '.join(sorted(required - item.keys()))}")
+        return [item.get(name, default) for name, default in zip(names, defaults)]
+    adapt.fields = names
+    return adapt
+
+async def _run_batch(op: str, fn, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Apply the mutation fn to each item on the writer thread, capturing per-item errors."""
+    loop = asyncio.get_running_loop()
+    adapt = _ADAPTERS[fn]
+
+    async def run_one(item: Dict[str, Any]) -> Dict[str, Any]:
+        return await loop.run_in_executor(_WRITER, fn, *adapt(item))
+
+    results = await asyncio.gather(*(run_one(item) for item in items), return_exceptions=True)
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            _log_error(f"Error in {op}", result)
+            results[i] = {"error": str(result)}
+    if not all(_is_error(result) for result in results):
+        _record_write(None)
+    return results
+
+async def _run_bulk(op: str, fn, bulk_fn, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Validate each item against fn's fields, then hand every valid item to bulk_fn in one call."""
+    adapt = _ADAPTERS[fn]
+    results: List[Any] = []
+    payloads: List[Dict[str, Any]] = []
+    for item in items:
+        try:
+            payloads.append(dict(zip(adapt.fields, adapt(item))))
+        except ValueError as e:
+            _log_error(f"Error in {op}", e)
+            results.append({"error": str(e)})
+        else:
+            results.append(None)
+    if payloads:
+        try:
+            done = iter(await _in_writer(bulk_fn, payloads))
+        except Exception as e:
+            _log_error(f"Error in {op}", e)
+            done = iter([{"error": str(e)} for _ in payloads])
+        results = [next(done) if result is None else result for result in results]
+    if not all(_is_error(result) for result in results):
+        _record_write(None)
+    return results
+
+# Read coalescer: list reads arriving within a short window are grouped, and each distinct
+# (fn, args) pair is fetched once with the result fanned back out to every waiter
+_COALESCE_WINDOW = 0.002
+_pending_reads: Dict[tuple, List[asyncio.Future]] = {}
+_flush_tasks: set = set()
+
+async def _coalesced_read(fn, *args) -> Any:
+    result = fn.peek(*args)
+    if result is not _MISSING:
+        return result
+    loop = asyncio.get_running_loop()
+    if not _pending_reads:
+        loop.call_later(_COALESCE_WINDOW, _schedule_read_flush)
+    waiter = loop.create_future()
+    _pending_reads.setdefault((fn, args), []).append(waiter)
+    return await waiter
+
+def _schedule_read_flush() -> None:
+    task = asyncio.ensure_future(_flush_reads())
+    _flush_tasks.add(task)
+    task.add_done_callback(_flush_tasks.discard)
+
+async def _flush_reads() -> None:
+    pending = dict(_pending_reads)
+    _pending_reads.clear()
+
+    async def resolve(key: tuple, waiters: List[asyncio.Future]) -> None:
+        fn, args = key
+        try:
+            result = await _read(fn, *args)
+        except Exception as e:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+        else:
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(result)
+
+    await asyncio.gather(*(resolve(key, waiters) for key, waiters in pending.items()))
+
+# Resolved on first use and kept for the life of the process; the default context cannot be deleted
+_default_ctx_id: Optional[str] = None
+
+def _default_context_id() -> str:
+    """Id of the context named "default", falling back to the task manager's default id."""
+    global _default_ctx_id
+    if _default_ctx_id is None:
+        _default_ctx_id = next(
+            (c["id"] for c in tm_context_list() if c["name"].lower() == "default"), _tm("default_context_id")
+        )
+    return _default_ctx_id
+
+# Per-item operations; their signatures also define the fields each batch item accepts
+def _task_create(title: str, description: Optional[str] = None, deadline: Optional[str] = None,
+                 parent_id: Optional[int] = None, context_id: Optional[str] = None,
+                 how_to_guide: Optional[str] = None) -> Dict[str, Any]:
+    """Never called: task_create_many only checks items against this signature, then inserts them with _task_create_bulk."""
+
+def _task_create_bulk(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    default_id = _default_context_id()
+    return tm_task_create_bulk([{**item, "context_id": item["context_id"] or default_id} for item in items])
+
+def _task_update(id: int, title: Optional[str] = None, description: Optional[str] = None,
+                 deadline: Optional[str] = None, completed: Optional[bool] = None,
+                 context_id: Optional[str] = None, how_to_guide: Optional[str] = None) -> Dict[str, Any]:
+    return tm_task_update(id, title, description, deadline, completed, how_to_guide, context_id)
+
+def _task_delete(id: int, context_id: Optional[str] = None) -> Dict[str, Any]:
+    return tm_task_delete(id, context_id)
+
+def _task_toggle(id: int, recursive: bool = False, context_id: Optional[str] = None) -> Dict[str, Any]:
+    return tm_task_toggle_completion(id, recursive, context_id)
+
+_ADAPTERS = {fn: _compile_adapter(fn) for fn in (_task_create, _task_update, _task_delete, _task_toggle)}
+
+# Task fields left out of responses when they hold their default value, unless verbose=True
+_TASK_DEFAULTS = {"description": "", "deadline": None, "completed": False, "how_to_guide": "", "subtasks": []}
+
+def _trim(task: Any) -> Any:
+    """Drop default-valued fields from a task dict and its subtasks; other results pass through."""
+    if not isinstance(task, dict) or "title" not in task:
+        return task
+    trimmed = {k: v for k, v in task.items() if _TASK_DEFAULTS.get(k, _MISSING) != v}
+    # subtasks is None where a depth limit cut the tree off
+    if trimmed.get("subtasks"):
+        trimmed["subtasks"] = [_trim(subtask) for subtask in trimmed["subtasks"]]
+    return trimmed
+
+def _shape(result: Any, verbose: bool) -> Any:
+    if verbose:
+        return result
+    if isinstance(result, list):
+        return [_trim(task) for task in result]
+    return _trim(result)
+
+@cached_read
+def _context_list() -> List[Dict[str, Any]]:
+    return tm_context_list()
+
+@cached_read
+def _task_list(context_id: Optional[str]) -> List[Dict[str, Any]]:
+    return tm_task_list(context_id or _default_context_id())
+
+@cached_read
+def _task_get(id: int, depth: Optional[int] = None) -> Dict[str, Any]:
+    return tm_task_get_with_subtasks(id, None, depth)
 
 # Context Management
 @mcp.tool()
-def context_create(name: str, description: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Create a new context session for organizing task items.
-    
-    A context represents a separate workspace or project area for tasks. 
-    Each context has its own set of tasks that can be managed independently.
-    
-    Args:
-        name: The name of the context (e.g., "Work", "Personal", "Project X")
-        description: An optional description providing more details about the context's purpose
-    
-    Returns:
-        Dict containing the newly created context with fields:
-        - id: A unique identifier for the context
-        - name: The name provided
-        - description: The description provided
-        - created_at: Timestamp when the context was created
-    
-    Example:
-        context_create("Work", "Tasks related to my job")
-    """
-    try:
-        return tm_context_create(name, description or "")
-    except Exception as e:
-        logger.exception("Error in context_create")
-        return {"error": str(e)}
+@_safe
+async def context_create(name: str, description: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Create a new context (a separate workspace for tasks).
+    Full docs: task-server://docs/context_create
+    """
+    return _record_write(await _in_writer(tm_context_create, name, description))
 
 @mcp.tool()
-def context_delete(context_id: str) -> Dict[str, Any]:
-    """
-    Delete a context and all its associated tasks permanently.
-    
-    This operation cannot be undone. The default context cannot be deleted.
-    
-    Args:
-        context_id: The unique identifier of the context to delete
-    
-    Returns:
-        Dict with success or error message:
-        - On success: {"success": True, "message": "Context 'NAME' deleted"}
-        - On error: {"error": "Error message"}
-    
-    Example:
-        context_delete("a1b2c3d4-e5f6-7890-abcd-1234567890ab")
-    """
-    try:
-        return tm_context_delete(context_id)
-    except Exception as e:
-        logger.exception("Error in context_delete")
-        return {"error": str(e)}
+@_safe
+async def context_delete(context_id: str) -> Dict[str, Any]:
+    """
+    Delete a context and all its tasks permanently. The default context cannot be deleted.
+    Full docs: task-server://docs/context_delete
+    """
+    result = _record_write(await _in_writer(tm_context_delete, context_id))
+    if not _is_error(result):
+        with _READ_CACHE_LOCK:
+            _PINNED_KEYS.discard(("_task_list", (context_id,)))
+    return result
 
 @mcp.tool()
-def context_list() -> List[Dict[str, Any]]:
-    """
-    List all available contexts in the system.
-    
-    IMPORTANT: Always call this tool first before interacting with tasks. This ensures you know which contexts are available and can select the appropriate one for further actions.
-    
-    Returns a list of all contexts, including the default context which is always present.
-    Each context contains tasks that can be accessed via task_list().
-    
-    Returns:
-        List of context dictionaries, each containing:
-        - id: The unique identifier for the context
-        - name: The name of the context
-        - description: Description of the context
-        - created_at: When the context was created
-    
-    Example response:
-        [
-            {
-                "id": "default",
-                "name": "Default",
-                "description": "Default context",
-                "created_at": "2023-04-01T12:00:00.000000"
-            },
-            {
-                "id": "a1b2c3d4-e5f6-7890-abcd-1234567890ab",
-                "name": "Work",
-                "description": "Work-related tasks",
-                "created_at": "2023-04-15T09:30:00.000000"
-            }
-        ]
-    """
-    try:
-        return tm_context_list()
-    except Exception as e:
-        logger.exception("Error in context_list")
-        return []
+@_safe_list
+async def context_list() -> List[Dict[str, Any]]:
+    """
+    List all contexts. IMPORTANT: always call this first to pick the context to work in.
+    Full docs: task-server://docs/context_list
+    """
+    return await _coalesced_read(_context_list)
+
+@mcp.tool()
+@_safe
+async def cache_pin(context_id: str) -> Dict[str, Any]:
+    """
+    Keep a frequently used context's task list in the read cache so it is never evicted.
+    Full docs: task-server://docs/cache_pin
+    """
+    key = ("_task_list", (context_id,))
+    if key not in _PINNED_KEYS:
+        if not any(c["id"] == context_id for c in await _coalesced_read(_context_list)):
+            return {"error": f"Context with ID {context_id} not found"}
+        with _READ_CACHE_LOCK:
+            if len(_PINNED_KEYS - _ALWAYS_PINNED) >= _MAX_PINNED_CONTEXTS:
+                return {"error": f"Cannot pin more than {_MAX_PINNED_CONTEXTS} contexts"}
+            _PINNED_KEYS.add(key)
+    return {"context_id": context_id, "pinned": True}
 
 # Task CRUD Operations
 @mcp.tool()
-def task_create(title: str, description: Optional[str] = None, deadline: Optional[str] = None, 
-                parent_id: Optional[int] = None, context_id: Optional[str] = None, how_to_guide: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Create a new task (aka a "todo" item) within a specific context.
-    
-    A task is essentially a "todo" item—these terms are interchangeable in this MCP server. The description should be short and to the point. Use how_to_guide for detailed, step-by-step instructions or explanations in markdown format. Do not repeat information between the description, how_to_guide, and subtasks. If you provide a how_to_guide, do not create subtasks for the same steps covered in the guide—choose one approach for detailed steps. Only apply a how_to_guide to edge (leaf) tasks that do not have subtasks; parent tasks with subtasks should not have a how_to_guide.
-    The how_to_guide should include enough information to pickup the task without any additional context (so should include all the context necessary)
-    
-    Args:
-        title: The title/name of the task ("todo" item) (required)
-        description: Short summary of what the task involves (keep it brief)
-        deadline: Optional deadline in ISO format (e.g., "2025-04-30T23:59:59")
-        parent_id: If provided, creates this task as a subtask of the task with this ID
-        context_id: The context to add this task to (uses default context if not specified)
-        how_to_guide: Markdown-formatted detailed instructions for the task (only for leaf tasks)
-    
-    Returns:
-        Dict containing the newly created task ("todo" item) with fields:
-        - id: Unique numeric identifier
-        - title: The title provided
-        - description: The description provided
-        - deadline: The deadline if provided
-        - completed: Always false for new tasks
-        - created_at: Timestamp when created
-        - how_to_guide: The markdown guide if provided
-        - subtasks: Empty list for new tasks
-    
-    Example:
-        task_create(
-            title="Implement login feature",
-            description="Create login page with username/password fields",
-            deadline="2025-05-01T17:00:00",
-            how_to_guide="## Login Implementation\n1. Create form\n2. Add validation\n3. Connect to backend"
-        )
+async def task_create(title: str, description: Optional[str] = None, deadline: Optional[str] = None, 
+                parent_id: Optional[int] = None, context_id: Optional[str] = None, how_to_guide: Optional[str] = None,
+                verbose: bool = False) -> Dict[str, Any]:
+    """
+    Create a new task (aka "todo" item), optionally as a subtask of parent_id, in a context (default if omitted).
+    Full docs: task-server://docs/task_create
     """
-    try:
-        return tm_task_create(title, description or "", deadline, parent_id, context_id, how_to_guide or "")
-    except Exception as e:
-        logger.exception("Error in task_create")
-        return {"error": str(e)}
+    return _shape((await task_create_many([{
+        "title": title, "description": description, "deadline": deadline,
+        "parent_id": parent_id, "context_id": context_id, "how_to_guide": how_to_guide,
+    }]))[0], verbose)
 
 @mcp.tool()
-def task_update(id: int, title: Optional[str] = None, description: Optional[str] = None, 
+async def task_update(id: int, title: Optional[str] = None, description: Optional[str] = None, 
                 deadline: Optional[str] = None, completed: Optional[bool] = None,
-                context_id: Optional[str] = None, how_to_guide: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Update a task ("todo" item)'s properties while preserving its subtasks structure.
-    
-    A task is essentially a "todo" item—these terms are interchangeable in this MCP server. The description should be short and to the point. Use how_to_guide for detailed, step-by-step instructions or explanations in markdown format. Do not repeat information between the description, how_to_guide, and subtasks. If you provide a how_to_guide, do not create subtasks for the same steps covered in the guide—choose one approach for detailed steps. Only apply a how_to_guide to edge (leaf) tasks that do not have subtasks; parent tasks with subtasks should not have a how_to_guide.
-    
-    Args:
-        id: The unique ID of the task ("todo" item) to update (required)
-        title: New title if you want to change it
-        description: Short summary (keep it brief)
-        deadline: New deadline in ISO format (or null to remove deadline)
-        completed: New completion status (True/False)
-        context_id: The context to search in (uses default if not specified)
-        how_to_guide: New markdown-formatted detailed instructions for the task (only for leaf tasks)
-    
-    Returns:
-        Dict containing the updated task ("todo" item) with all fields (including unchanged ones)
-        or an error message if the task wasn't found:
-        - On error: {"error": "Error message"}
-    
-    Example:
-        task_update(
-            id=42,
-            title="Updated: Implement login feature",
-            completed=True,
-            how_to_guide="## Revised Login Implementation\n1. Use OAuth instead\n2. Add SSO support"
-        )
+                context_id: Optional[str] = None, how_to_guide: Optional[str] = None,
+                verbose: bool = False) -> Dict[str, Any]:
     """
-    try:
-        return tm_task_update(id, title, description, deadline, completed, how_to_guide, context_id)
-    except Exception as e:
-        logger.exception("Error in task_update")
-        return {"error": str(e)}
+    Update a task's title, description, deadline, completion or how_to_guide, preserving its subtasks.
+    Full docs: task-server://docs/task_update
+    """
+    return _shape((await task_update_many([{
+        "id": id, "title": title, "description": description, "deadline": deadline,
+        "completed": completed, "context_id": context_id, "how_to_guide": how_to_guide,
+    }]))[0], verbose)
 
 @mcp.tool()
-def task_delete(id: int, context_id: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Delete a task ("todo" item) and all its subtasks permanently.
-    
-    A task is essentially a "todo" item—these terms are interchangeable in this MCP server. This operation cannot be undone. If you delete a task that has subtasks, all subtasks will also be deleted.
-    
-    Args:
-        id: The unique ID of the task ("todo" item) to delete (required)
-        context_id: The context to search in (uses default if not specified)
-    
-    Returns:
-        Dict with success or error message:
-        - On success: {"success": True, "message": "Task 'TITLE' deleted"}
-        - On error: {"error": "Error message"}
-    
-    Example:
-        task_delete(id=42)
-    """
-    try:
-        return tm_task_delete(id, context_id)
-    except Exception as e:
-        logger.exception("Error in task_delete")
-        return {"error": str(e)}
+async def task_delete(id: int, context_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Delete a task and all its subtasks permanently.
+    Full docs: task-server://docs/task_delete
+    """
+    return (await task_delete_many([{"id": id, "context_id": context_id}]))[0]
 
 @mcp.tool()
-def task_get(id: int) -> Dict[str, Any]:
-    """
-    Get a specific task ("todo" item) and its entire subtask hierarchy.
-    
-    A task is essentially a "todo" item—these terms are interchangeable in this MCP server. Retrieves comprehensive information about a task, including its complete subtask tree with all properties of each subtask.
-    
-    Args:
-        id: The unique ID of the task ("todo" item) to retrieve (required)
-    
-    Returns:
-        Complete task ("todo" item) object with all fields and all nested subtasks
-        or an error message if not found:
-        - On error: {"error": "Error message"}
-    
-    Example response:
-    {
-        "id": 42,
-        "title": "Implement feature X",
-        "description": "Create new functionality",
-        "deadline": "2025-05-01T17:00:00",
-        "completed": false,
-        "created_at": "2025-04-15T10:00:00.123456",
-        "how_to_guide": "## Steps\n1. First step\n2. Second step",
-        "subtasks": [
-            {
-                "id": 43,
-                "title": "Subtask 1",
-                "description": "Part of the implementation",
-                "deadline": null,
-                "completed": true,
-                "created_at": "2025-04-15T10:05:00.123456",
-                "how_to_guide": "",
-                "subtasks": []
-            }
-        ]
-    }
-    """
-    try:
-        return tm_task_get_with_subtasks(id)
-    except Exception as e:
-        logger.exception("Error in task_get")
-        return {"error": str(e)}
+@_safe
+async def task_get(id: int, depth: Optional[int] = None, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Get a task and its subtask hierarchy, optionally only down to depth levels.
+    Full docs: task-server://docs/task_get
+    """
+    return _shape(await _read(_task_get, id, depth), verbose)
 
 @mcp.tool()
-def task_list(context_id: Optional[str] = None) -> List[Dict[str, Any]]:
-    """
-    List all top-level tasks (aka "todo" items) in a specific context.
-    
-    A task is essentially a "todo" item—these terms are interchangeable in this MCP server. Returns all root-level tasks in the specified context (or default context). Each task includes its full subtask hierarchy.
-    
-    Args:
-        context_id: The context to list tasks ("todo" items) from (uses default if not specified)
-    
-    Returns:
-        List of task ("todo" item) objects, each containing all fields and its subtask hierarchy.
-        Returns an empty list if no tasks exist or if the context doesn't exist.
-    
-    Example:
-        task_list(context_id="work-context")
-    """
-    try:
-        return tm_task_list(context_id)
-    except Exception as e:
-        logger.exception("Error in task_list")
-        return []
+@_safe_list
+async def task_list(context_id: Optional[str] = None, verbose: bool = False) -> List[Dict[str, Any]]:
+    """
+    List the top-level tasks, with their subtask hierarchies, in a context (default if omitted).
+    Full docs: task-server://docs/task_list
+    """
+    return _shape(await _coalesced_read(_task_list, context_id), verbose)
 
 # Task Specialized Operations
 @mcp.tool()
-def task_toggle_completion(id: int, recursive: bool = False, context_id: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Toggle the completed status of a task item (and optionally all its subtasks).
-    
-    Changes a task's status from incomplete to complete or vice versa.
-    If recursive=True, all subtasks will be set to the same status as the parent.
-    
-    Args:
-        id: The unique ID of the task item to toggle (required)
-        recursive: If True, also toggle all subtasks to match the parent's new status
-        context_id: The context to search in (uses default if not specified)
-    
-    Returns:
-        Dict containing the updated task with all fields
-        or an error message if the task wasn't found:
-        - On error: {"error": "Error message"}
-    
-    Example:
-        task_toggle_completion(id=42, recursive=True)
-    """
-    try:
-        return tm_task_toggle_completion(id, recursive, context_id)
-    except Exception as e:
-        logger.exception("Error in task_toggle_completion")
-        return {"error": str(e)}
+async def task_toggle_completion(id: int, recursive: bool = False, context_id: Optional[str] = None,
+                                 verbose: bool = False) -> Dict[str, Any]:
+    """
+    Toggle a task's completed status; recursive=True applies the new status to all subtasks.
+    Full docs: task-server://docs/task_toggle_completion
+    """
+    return _shape((await task_toggle_many([{"id": id, "recursive": recursive, "context_id": context_id}]))[0], verbose)
 
 @mcp.tool()
-def task_move(id: int, new_parent_id: Optional[int] = None, 
+@_safe
+async def task_move(id: int, new_parent_id: Optional[int] = None, 
               source_context_id: Optional[str] = None, 
-              target_context_id: Optional[str] = None) -> Dict[str, Any]:
-    """
-    Move a task and its subtasks to a new parent or to root level, optionally between contexts.
-    
-    This function allows for complex reorganization of the task hierarchy:
-    - Move a subtask to become a root-level task
-    - Move a root task to become a subtask of another task
-    - Move a subtask to become a subtask of a different parent
-    - Move tasks between different contexts
-    
-    Args:
-        id: The unique ID of the task subtree to move (required)
-        new_parent_id: The ID of the new parent, or None to move to root level
-        source_context_id: The context to move from (uses default if not specified)
-        target_context_id: The context to move to (uses source_context_id if not specified)
-    
-    Returns:
-        Dict containing the moved task (with all subtasks)
-        or an error message if operation failed:
-        - On error: {"error": "Error message"}
-    
-    Constraints:
-    - Cannot move a task to be its own child
-    - Cannot move a task to be a child of one of its own descendants
-    
-    Example:
-        task_move(id=42, new_parent_id=50, target_context_id="work-context")
-    """
-    try:
-        return tm_task_move(id, new_parent_id, source_context_id, target_context_id)
-    except Exception as e:
-        logger.exception("Error in task_move")
-        return {"error": str(e)}
\ No newline at end of file
+              target_context_id: Optional[str] = None, verbose: bool = False) -> Dict[str, Any]:
+    """
+    Move a task and its subtasks to a new parent (or root level), optionally between contexts.
+    Full docs: task-server://docs/task_move
+    """
+    return _shape(_record_write(await _in_writer(tm_task_move, id, new_parent_id, source_context_id, target_context_id)), verbose)
+
+# Bulk Task Operations
+@mcp.tool()
+async def task_create_many(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create several tasks in one call; each item takes the task_create fields. Prefer over repeated task_create.
+    Full docs: task-server://docs/task_create_many
+    """
+    return await _run_bulk("task_create", _task_create, _task_create_bulk, items)
+
+@mcp.tool()
+async def task_update_many(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Update several tasks in one call; each item takes the task_update fields. Prefer over repeated task_update.
+    Full docs: task-server://docs/task_update_many
+    """
+    return await _run_batch("task_update", _task_update, items)
+
+@mcp.tool()
+async def task_delete_many(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Delete several tasks in one call; each item takes the task_delete fields. Prefer over repeated task_delete.
+    Full docs: task-server://docs/task_delete_many
+    """
+    return await _run_batch("task_delete", _task_delete, items)
+
+@mcp.tool()
+async def task_toggle_many(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Toggle several tasks in one call; each item takes the task_toggle_completion fields.
+    Full docs: task-server://docs/task_toggle_many
+    """
+    return await _run_batch("task_toggle_completion", _task_toggle, items)
+
+# Tool Documentation
+_TOOL_DOCS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tool_docs")
+
+@functools.lru_cache(maxsize=None)
+def _read_tool_doc(name: str) -> str:
+    with open(os.path.join(_TOOL_DOCS_DIR, f"{name}.md"), encoding="utf-8") as f:
+        return f.read()
+
+@mcp.resource("task-server://docs/{tool}", mime_type="text/markdown")
+def tool_docs(tool: str) -> str:
+    """
+    Full documentation for a task server tool: argument details, return shapes and examples.
+    The tool descriptions are kept short; read this resource when more detail is needed.
+    """
+    return _read_tool_doc(os.path.basename(tool))
+
+# Register each shipped doc as a concrete resource too: FastMCP resolves those with a dict lookup
+# and only falls back to matching and instantiating the template above for unknown names
+for _doc in sorted(os.listdir(_TOOL_DOCS_DIR)):
+    _name, _ext = os.path.splitext(_doc)
+    if _ext == ".md":
+        mcp.add_resource(FunctionResource(
+            uri=f"task-server://docs/{_name}",
+            name=f"{_name} docs",
+            mime_type="text/markdown",
+            fn=functools.partial(_read_tool_doc, _name),
+        ))
@@ -0,0 +1,38 @@
+"""
+Test base class that points the task store at a fresh temporary database
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from sqlalchemy import create_engine
+
+import server
+from utils import task_manager
+
+
+class TempStoreTestCase(unittest.TestCase):
+    """Runs each test against an empty database in a temporary directory."""
+
+    def setUp(self):
+        """Point the task store at a fresh database in a temporary directory."""
+        self.test_dir = tempfile.mkdtemp(prefix="test_task_store_")
+        self.old_cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        self.old_engine = task_manager.engine
+        task_manager.engine = create_engine(f"sqlite:///{os.path.join(self.test_dir, 'db.sqlite3')}")
+        task_manager.SessionLocal.configure(bind=task_manager.engine)
+        task_manager._initialized = False
+        server._READ_CACHE.clear()
+
+    def tearDown(self):
+        """Restore the real database and clean up."""
+        task_manager.engine.dispose()
+        task_manager.engine = self.old_engine
+        task_manager.SessionLocal.configure(bind=self.old_engine)
+        task_manager._initialized = False
+        server._READ_CACHE.clear()
+        os.chdir(self.old_cwd)
+        shutil.rmtree(self.test_dir, ignore_errors=True)
@@ -0,0 +1,41 @@
+"""
+Tests for the per-item batch tools
+"""
+
+import asyncio
+import unittest
+
+import server
+from tests.temp_store import TempStoreTestCase
+
+
+class TestBatchTools(TempStoreTestCase):
+    """Batch items are applied one by one, each with its own result."""
+
+    def test_large_batches_across_event_loops(self):
+        """Batches keep working when each one runs under a new event loop."""
+        created = asyncio.run(server.task_create_many([{"title": f"task {i}"} for i in range(40)]))
+        ids = [{"id": task["id"]} for task in created]
+
+        toggled = asyncio.run(server.task_toggle_many(ids))
+        deleted = asyncio.run(server.task_delete_many(ids))
+
+        self.assertFalse(any("error" in result for result in toggled + deleted))
+
+    def test_item_errors_are_isolated(self):
+        """An unknown id or field fails its own item only."""
+        task = asyncio.run(server.task_create("kept"))
+
+        results = asyncio.run(server.task_update_many([
+            {"id": task["id"], "title": "renamed"},
+            {"id": 999999, "title": "missing"},
+            {"id": task["id"], "colour": "red"},
+        ]))
+
+        self.assertEqual(results[0]["title"], "renamed")
+        self.assertIn("error", results[1])
+        self.assertIn("error", results[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Tests for the JSON-RPC batch stdio transport
+"""
+
+import json
+import unittest
+
+import anyio
+import mcp.types as types
+from mcp.shared.message import SessionMessage
+
+from utils.batch_stdio import batch_stdio_server
+
+
+class _Stdin:
+    """Async line source standing in for the wrapped stdin."""
+
+    def __init__(self, lines):
+        self.lines = [line + "\n" for line in lines]
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.lines:
+            raise StopAsyncIteration
+        return self.lines.pop(0)
+
+
+class _Stdout:
+    """Collects the lines the transport writes."""
+
+    def __init__(self):
+        self.text = ""
+
+    async def write(self, text):
+        self.text += text
+
+    async def flush(self):
+        pass
+
+    def messages(self):
+        return [json.loads(line) for line in self.text.splitlines()]
+
+
+def _request(id):
+    return {"jsonrpc": "2.0", "id": id, "method": "ping"}
+
+
+class TestBatchStdio(unittest.TestCase):
+    """Batch arrays are answered according to JSON-RPC 2.0."""
+
+    def run_server(self, line):
+        """Feed one line to the transport, answer every request it forwards, return what it wrote."""
+        stdout = _Stdout()
+
+        async def main():
+            async with batch_stdio_server(_Stdin([line]), stdout) as (read_stream, write_stream):
+                async with read_stream:
+                    async for message in read_stream:
+                        if isinstance(message, Exception):
+                            continue
+                        request = message.message.root
+                        if isinstance(request, types.JSONRPCRequest):
+                            await write_stream.send(SessionMessage(types.JSONRPCMessage(
+                                types.JSONRPCResponse(jsonrpc="2.0", id=request.id, result={})
+                            )))
+                await write_stream.aclose()
+
+        anyio.run(main)
+        return stdout.messages()
+
+    def test_empty_batch(self):
+        """An empty array gets a single Invalid Request error."""
+        self.assertEqual(self.run_server("[]"), [{
+            "jsonrpc": "2.0", "id": None,
+            "error": {"code": types.INVALID_REQUEST, "message": "Invalid Request"},
+        }])
+
+    def test_invalid_member_is_answered(self):
+        """An invalid member gets an error in the response array alongside the valid responses."""
+        [responses] = self.run_server(json.dumps([_request(1), {"id": 2, "foo": "bar"}, 3]))
+
+        self.assertEqual(sorted(str(r["id"]) for r in responses), ["1", "2", "None"])
+        errors = [r for r in responses if "error" in r]
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(all(r["error"]["code"] == types.INVALID_REQUEST for r in errors))
+
+    def test_all_invalid_members(self):
+        """A batch of only invalid members is answered with an array of errors."""
+        [responses] = self.run_server("[1, 2]")
+
+        self.assertEqual([r["error"]["code"] for r in responses], [types.INVALID_REQUEST] * 2)
+
+    def test_valid_batch(self):
+        """Every request in a batch is answered in one array."""
+        [responses] = self.run_server(json.dumps([_request(1), _request(2)]))
+
+        self.assertEqual(sorted(r["id"] for r in responses), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for cache_pin
+"""
+
+import asyncio
+import unittest
+
+import server
+from utils import task_manager
+from tests.temp_store import TempStoreTestCase
+
+
+class TestCachePin(TempStoreTestCase):
+    """Pinning is limited to existing contexts and capped."""
+
+    def setUp(self):
+        super().setUp()
+        self.old_pinned = set(server._PINNED_KEYS)
+
+    def tearDown(self):
+        server._PINNED_KEYS.clear()
+        server._PINNED_KEYS.update(self.old_pinned)
+        super().tearDown()
+
+    def pin(self, context_id):
+        return asyncio.run(server.cache_pin(context_id))
+
+    def test_pin_existing_context(self):
+        """An existing context is pinned."""
+        context = task_manager.create_context("work")
+
+        self.assertEqual(self.pin(context["id"]), {"context_id": context["id"], "pinned": True})
+        self.assertIn(("_task_list", (context["id"],)), server._PINNED_KEYS)
+
+    def test_unknown_context_rejected(self):
+        """A context that doesn't exist is not pinned."""
+        result = self.pin("nope")
+
+        self.assertIn("error", result)
+        self.assertNotIn(("_task_list", ("nope",)), server._PINNED_KEYS)
+
+    def test_pin_limit(self):
+        """Pins beyond the limit are refused, so eviction always has unpinned entries to drop."""
+        contexts = [task_manager.create_context(f"c{i}") for i in range(server._MAX_PINNED_CONTEXTS + 1)]
+
+        results = [self.pin(context["id"]) for context in contexts]
+
+        self.assertFalse(any("error" in result for result in results[:-1]))
+        self.assertIn("error", results[-1])
+        # Pinning again, and pinning the default context, still succeed at the limit
+        self.assertNotIn("error", self.pin(contexts[0]["id"]))
+        self.assertNotIn("error", self.pin("default"))
+
+    def test_deleted_context_unpinned(self):
+        """Deleting a pinned context frees its pin."""
+        context = task_manager.create_context("temp")
+        self.pin(context["id"])
+
+        asyncio.run(server.context_delete(context["id"]))
+
+        self.assertNotIn(("_task_list", (context["id"],)), server._PINNED_KEYS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests for the one-time tasks.json import
+"""
+
+import asyncio
+import json
+import os
+import unittest
+
+import server
+from tests.temp_store import TempStoreTestCase
+
+
+class TestLegacyImport(TempStoreTestCase):
+    """A tasks.json in the working directory is imported on first use."""
+
+    def write_legacy(self, data):
+        with open("tasks.json", "w") as f:
+            json.dump(data, f)
+
+    def test_import_renames_file(self):
+        """Imported tasks are listed and the file is renamed so it is not imported again."""
+        self.write_legacy([{"id": 1, "title": "old", "subtasks": [{"id": 2, "title": "old child"}]}])
+
+        tasks = asyncio.run(server.task_list())
+
+        self.assertEqual(tasks[0]["title"], "old")
+        self.assertEqual(tasks[0]["subtasks"][0]["title"], "old child")
+        self.assertFalse(os.path.exists("tasks.json"))
+        self.assertTrue(os.path.exists("tasks.json.migrated"))
+
+    def test_malformed_file_does_not_break_store(self):
+        """A task without a title skips the import but leaves every tool working."""
+        self.write_legacy([{"id": 3}])
+
+        contexts = asyncio.run(server.context_list())
+        created = asyncio.run(server.task_create("new"))
+
+        self.assertEqual([context["id"] for context in contexts], ["default"])
+        self.assertNotIn("error", created)
+        self.assertTrue(os.path.exists("tasks.json"))
+        self.assertEqual([task["title"] for task in asyncio.run(server.task_list())], ["new"])
+
+
+if __name__ == "__main__":
+    unittest.main()
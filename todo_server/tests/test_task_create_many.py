@@ -0,0 +1,52 @@
+"""
+Tests for task_create_many's per-item error handling
+"""
+
+import asyncio
+import unittest
+
+import server
+from tests.temp_store import TempStoreTestCase
+
+
+class TestTaskCreateMany(TempStoreTestCase):
+    """A bad item in a batch fails on its own; the other items are still created."""
+
+    def create_many(self, items):
+        return asyncio.run(server.task_create_many(items))
+
+    def test_invalid_title_only_fails_its_item(self):
+        """A null title is reported for its item without failing the rest of the batch."""
+        results = self.create_many([{"title": None}, {"title": "ok"}])
+
+        self.assertIn("error", results[0])
+        self.assertNotIn("error", results[1])
+        self.assertEqual(results[1]["title"], "ok")
+
+    def test_invalid_field_types(self):
+        """Wrongly typed fields are reported per item."""
+        results = self.create_many([
+            {"title": ""},
+            {"title": "a", "deadline": {"at": "noon"}},
+            {"title": "b", "parent_id": "1"},
+            {"title": "c"},
+        ])
+
+        self.assertEqual([("error" in result) for result in results], [True, True, True, False])
+
+    def test_errors_do_not_expose_sql(self):
+        """Item errors describe the field, not the failed statement."""
+        results = self.create_many([{"title": None}])
+
+        self.assertNotIn("INSERT", results[0]["error"])
+
+    def test_created_items_are_listed(self):
+        """Only the valid items end up in the task list."""
+        self.create_many([{"title": None}, {"title": "ok"}])
+
+        tasks = asyncio.run(server.task_list(verbose=True))
+        self.assertEqual([task["title"] for task in tasks], ["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Tests for task_get's depth limit
+"""
+
+import asyncio
+import unittest
+
+import server
+from utils import task_manager
+from tests.temp_store import TempStoreTestCase
+
+
+class TestTaskGetDepth(TempStoreTestCase):
+    """task_get on a three-level tree: root -> child -> grandchild."""
+
+    def setUp(self):
+        """Create the tree in a fresh database."""
+        super().setUp()
+        self.root = task_manager.add_task("root")
+        self.child = task_manager.add_task("child", parent_id=self.root["id"])
+        self.grandchild = task_manager.add_task("grandchild", parent_id=self.child["id"])
+
+    def task_get(self, **kwargs):
+        return asyncio.run(server.task_get(self.root["id"], **kwargs))
+
+    def test_depth_zero_cuts_off_subtasks(self):
+        """depth=0 returns the task alone, with subtasks null since it has children."""
+        result = self.task_get(depth=0)
+
+        self.assertNotIn("error", result)
+        self.assertEqual(result["title"], "root")
+        self.assertIsNone(result["subtasks"])
+
+    def test_depth_one_cuts_off_grandchildren(self):
+        """depth=1 keeps the child and reports its subtasks as null."""
+        result = self.task_get(depth=1)
+
+        self.assertNotIn("error", result)
+        child = result["subtasks"][0]
+        self.assertEqual(child["title"], "child")
+        self.assertIsNone(child["subtasks"])
+
+    def test_depth_limit_verbose(self):
+        """The cut-off is reported the same way with verbose=True."""
+        result = self.task_get(depth=1, verbose=True)
+
+        self.assertIsNone(result["subtasks"][0]["subtasks"])
+
+    def test_depth_reaching_leaves_omits_subtasks(self):
+        """A depth that reaches the leaves returns the full tree; leaves omit their empty subtasks."""
+        result = self.task_get(depth=2)
+
+        grandchild = result["subtasks"][0]["subtasks"][0]
+        self.assertEqual(grandchild["title"], "grandchild")
+        self.assertNotIn("subtasks", grandchild)
+
+    def test_negative_depth_rejected(self):
+        """A negative depth is an error rather than an empty subtask list."""
+        result = self.task_get(depth=-1)
+
+        self.assertIn("error", result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Tests for task_toggle_completion
+"""
+
+import asyncio
+import unittest
+
+import server
+from utils import task_manager
+from tests.temp_store import TempStoreTestCase
+
+
+class TestTaskToggle(TempStoreTestCase):
+    """Toggling a task, with and without its subtasks."""
+
+    def setUp(self):
+        """Create a task with one subtask."""
+        super().setUp()
+        self.parent = task_manager.add_task("parent")
+        self.child = task_manager.add_task("child", parent_id=self.parent["id"])
+
+    def toggle(self, id, **kwargs):
+        return asyncio.run(server.task_toggle_completion(id, verbose=True, **kwargs))
+
+    def test_non_recursive_leaves_subtasks(self):
+        """recursive=False only flips the task itself."""
+        result = self.toggle(self.parent["id"])
+
+        self.assertTrue(result["completed"])
+        self.assertFalse(result["subtasks"][0]["completed"])
+
+    def test_recursive_applies_to_subtasks(self):
+        """recursive=True gives the subtasks the task's new status."""
+        result = self.toggle(self.parent["id"], recursive=True)
+
+        self.assertTrue(result["completed"])
+        self.assertTrue(result["subtasks"][0]["completed"])
+
+    def test_errors_match_for_both_modes(self):
+        """Unknown tasks and contexts are reported the same way whether or not recursive is set."""
+        for recursive in (False, True):
+            self.assertEqual(
+                self.toggle(self.parent["id"], recursive=recursive, context_id="nope"),
+                {"error": "Context with ID nope not found"},
+            )
+            self.assertEqual(
+                self.toggle(999999, recursive=recursive),
+                {"error": "Task with ID 999999 not found in any context"},
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
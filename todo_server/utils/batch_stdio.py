@@ -0,0 +1,127 @@
+"""
+Stdio transport that also accepts JSON-RPC batch arrays.
+
+The MCP SDK's stdio transport validates every line as a single JSON-RPC message, so a batch
+array (`[{...}, {...}]`) sent by a client is rejected. This variant splits a batch into its
+messages, hands them to the server like any other messages (the server already handles
+requests concurrently), and writes the responses back as one array once every request in
+the batch has been answered. Members that aren't valid JSON-RPC messages get an Invalid
+Request error in that array, and an empty batch gets a single Invalid Request error, as
+JSON-RPC 2.0 requires.
+"""
+import json
+import sys
+from contextlib import asynccontextmanager
+from io import TextIOWrapper
+from typing import Any, Dict, List
+
+import anyio
+import anyio.lowlevel
+import mcp.types as types
+from mcp.shared.message import SessionMessage
+
+class _Batch:
+    """Responses collected for one incoming batch, flushed once nothing is pending."""
+    __slots__ = ("pending", "responses")
+
+    def __init__(self, request_ids: List[Any]):
+        self.pending = set(request_ids)
+        self.responses: List[str] = []
+
+def _invalid_request(raw: Any = None) -> str:
+    """Serialized Invalid Request error, echoing the offending message's id if it has a usable one."""
+    request_id = raw.get("id") if isinstance(raw, dict) else None
+    if not isinstance(request_id, (str, int)) or isinstance(request_id, bool):
+        request_id = None
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": types.INVALID_REQUEST, "message": "Invalid Request"},
+    })
+
+@asynccontextmanager
+async def batch_stdio_server(stdin=None, stdout=None):
+    """Drop-in replacement for mcp.server.stdio.stdio_server with batch support."""
+    if not stdin:
+        stdin = anyio.wrap_file(TextIOWrapper(sys.stdin.buffer, encoding="utf-8", errors="replace"))
+    if not stdout:
+        stdout = anyio.wrap_file(TextIOWrapper(sys.stdout.buffer, encoding="utf-8"))
+
+    read_stream_writer, read_stream = anyio.create_memory_object_stream(0)
+    write_stream, write_stream_reader = anyio.create_memory_object_stream(0)
+    batch_of: Dict[Any, _Batch] = {}
+    # Both the reader (for invalid batches) and the writer write lines to stdout
+    write_lock = anyio.Lock()
+
+    async def write_line(text: str):
+        async with write_lock:
+            await stdout.write(text + "\n")
+            await stdout.flush()
+
+    async def read_batch(line: str):
+        try:
+            raw_messages = json.loads(line)
+        except Exception as exc:
+            await read_stream_writer.send(exc)
+            return
+        if not raw_messages:
+            await write_line(_invalid_request())
+            return
+        messages = []
+        errors: List[str] = []
+        for raw in raw_messages:
+            try:
+                messages.append(types.JSONRPCMessage.model_validate(raw))
+            except Exception:
+                errors.append(_invalid_request(raw))
+        # Register the batch before dispatching so no response can slip out on its own
+        request_ids = [m.root.id for m in messages if isinstance(m.root, types.JSONRPCRequest)]
+        if request_ids:
+            batch = _Batch(request_ids)
+            batch.responses.extend(errors)
+            for request_id in request_ids:
+                batch_of[request_id] = batch
+        elif errors:
+            # Nothing in the batch will be answered by the server, so reply with the errors now
+            await write_line("[" + ",".join(errors) + "]")
+        for message in messages:
+            await read_stream_writer.send(SessionMessage(message))
+
+    async def stdin_reader():
+        try:
+            async with read_stream_writer:
+                async for line in stdin:
+                    if line.lstrip().startswith("["):
+                        await read_batch(line)
+                        continue
+                    try:
+                        message = types.JSONRPCMessage.model_validate_json(line)
+                    except Exception as exc:
+                        await read_stream_writer.send(exc)
+                        continue
+                    await read_stream_writer.send(SessionMessage(message))
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async def stdout_writer():
+        try:
+            async with write_stream_reader:
+                async for session_message in write_stream_reader:
+                    message = session_message.message.root
+                    text = session_message.message.model_dump_json(by_alias=True, exclude_none=True)
+                    is_response = isinstance(message, (types.JSONRPCResponse, types.JSONRPCError))
+                    batch = batch_of.pop(message.id, None) if is_response else None
+                    if batch is None:
+                        await write_line(text)
+                        continue
+                    batch.responses.append(text)
+                    batch.pending.discard(message.id)
+                    if not batch.pending:
+                        await write_line("[" + ",".join(batch.responses) + "]")
+        except anyio.ClosedResourceError:
+            await anyio.lowlevel.checkpoint()
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(stdin_reader)
+        tg.start_soon(stdout_writer)
+        yield read_stream, write_stream
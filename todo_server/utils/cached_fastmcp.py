@@ -0,0 +1,97 @@
+from typing import Any, Awaitable, Callable, Dict, List
+from mcp.server.fastmcp import FastMCP
+from mcp.types import TextContent
+from utils.batch_stdio import batch_stdio_server
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _to_text_content(result: Any) -> List[TextContent]:
+    """Encode a plain JSON tool result the way FastMCP does, but with orjson."""
+    if isinstance(result, list):
+        return [content for item in result for content in _to_text_content(item)]
+    if not isinstance(result, str):
+        result = orjson.dumps(result, default=str, option=orjson.OPT_INDENT_2).decode()
+    return [TextContent(type="text", text=result)]
+
+class CachedFastMCP(FastMCP):
+    """
+    FastMCP server that builds its tools/list and resources/list responses once and encodes
+    tool results with orjson.
+
+    FastMCP rebuilds the listing (one MCP object per tool, including the full docstring and
+    input schema) on every list request. The registered tools and resources only change at
+    import time, so the listing is cached and dropped whenever something new is registered.
+    Tool results here are plain dicts and lists, which orjson serializes far faster than the
+    pydantic encoder FastMCP uses; anything else is left to FastMCP. The stdio transport also
+    accepts JSON-RPC batch arrays (see utils.batch_stdio).
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._list_cache: Dict[str, Any] = {}
+        super().__init__(*args, **kwargs)
+
+    def _invalidate_list_cache(self) -> None:
+        self._list_cache.clear()
+
+    async def _cached_list(self, key: str, build: Callable[[], Awaitable[Any]]) -> Any:
+        if key not in self._list_cache:
+            self._list_cache[key] = await build()
+        return self._list_cache[key]
+
+    async def list_tools(self):
+        return await self._cached_list("tools", super().list_tools)
+
+    async def list_resources(self):
+        return await self._cached_list("resources", super().list_resources)
+
+    async def list_resource_templates(self):
+        return await self._cached_list("resource_templates", super().list_resource_templates)
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]):
+        tool = self._tool_manager._tools.get(name)
+        if tool is None or not ORJSON_AVAILABLE:
+            return await super().call_tool(name, arguments)
+        # None of the registered tools take a Context, so only build one for those that do
+        context = self.get_context() if tool.context_kwarg is not None else None
+        result = await tool.run(arguments, context=context)
+        if not isinstance(result, (dict, list, str)):
+            return tool.fn_metadata.convert_result(result)
+        content = _to_text_content(result)
+        if getattr(tool, "output_schema", None) is None:
+            return content
+        return content, {"result": result} if tool.fn_metadata.wrap_output else result
+
+    async def run_stdio_async(self) -> None:
+        """Run the server over stdio, accepting JSON-RPC batch arrays as well as single messages."""
+        async with batch_stdio_server() as (read_stream, write_stream):
+            await self._mcp_server.run(
+                read_stream,
+                write_stream,
+                self._mcp_server.create_initialization_options(),
+            )
+
+    def add_tool(self, *args, **kwargs):
+        self._invalidate_list_cache()
+        return super().add_tool(*args, **kwargs)
+
+    def remove_tool(self, *args, **kwargs):
+        self._invalidate_list_cache()
+        return super().remove_tool(*args, **kwargs)
+
+    def add_resource(self, *args, **kwargs):
+        self._invalidate_list_cache()
+        return super().add_resource(*args, **kwargs)
+
+    def resource(self, *args, **kwargs):
+        register = super().resource(*args, **kwargs)
+
+        def decorator(fn):
+            # Templated resources bypass add_resource, so invalidate here as well
+            self._invalidate_list_cache()
+            return register(fn)
+
+        return decorator
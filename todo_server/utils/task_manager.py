@@ -1,25 +1,90 @@
 import json
+import logging
 import os
+import threading
 from typing import List, Dict, Any, Optional, Union
 from datetime import datetime
-from copy import deepcopy
 import uuid
-from anytree import Node, PreOrderIter
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import bindparam, create_engine, delete, event, insert, literal, select, type_coerce, update, Column, Integer, String, Boolean, DateTime, ForeignKey, Index, Text
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker
+from contextlib import contextmanager
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
 
-# Global data structures
-contexts: List[Dict[str, Any]] = []
-tasks_by_context: Dict[str, List[Node]] = {}
-next_id = 1
 default_context_id = "default"
 
 # SQLAlchemy setup
 Base = declarative_base()
 DB_PATH = os.path.join(os.path.dirname(__file__), '..', 'db.sqlite3')
 DB_URL = f'sqlite:///{os.path.abspath(DB_PATH)}'
-engine = create_engine(DB_URL, echo=False, future=True)
-SessionLocal = sessionmaker(bind=engine)
+# The server can run up to 32 reader threads plus a writer at once, more than the default pool
+# of 5 (+10 overflow) connections; LIFO keeps reusing the connections whose page caches are warm.
+# No pre-ping: connections to a local file don't go stale, and it would cost a query per checkout.
+engine = create_engine(DB_URL, echo=False, future=True, pool_size=8, max_overflow=32, pool_use_lifo=True)
+
+@event.listens_for(engine, "connect")
+def _sqlite_pragmas(dbapi_conn, _):
+    """
+    WAL lets readers run alongside the writer and makes each commit one append to the log
+    instead of several fsyncs; synchronous=NORMAL is durable in WAL mode except on power loss.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.close()
+# Objects stay readable after commit, so results can be built without reloading them
+SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
+
+@contextmanager
+def _transaction():
+    session = SessionLocal()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+def session_scope():
+    """
+    Provide a session that commits when the block completes and rolls back if it raises.
+    The database is set up on the first call.
+    """
+    if not _initialized:
+        _ensure_initialized()
+    return _transaction()
+
+_init_lock = threading.Lock()
+_initialized = False
+
+def _ensure_initialized():
+    """
+    Create missing tables and indexes, seed the default context and import any legacy tasks.json.
+    This runs once, on first use rather than at import, so importing the module touches no files.
+    """
+    global _initialized
+    with _init_lock:
+        if _initialized:
+            return
+        Base.metadata.create_all(engine)
+        # create_all skips indexes on tables that already exist, so add any missing ones to older databases
+        for index in Task.__table__.indexes:
+            index.create(engine, checkfirst=True)
+        with _transaction() as session:
+            _ensure_default_context(session)
+        migrate_legacy_tasks()
+        _initialized = True
 
 class Context(Base):
     __tablename__ = 'contexts'
@@ -42,130 +107,108 @@ class Task(Base):
     parent_id = Column(Integer, ForeignKey('tasks.id'), nullable=True)
     context = relationship('Context', back_populates='tasks')
     subtasks = relationship('Task', backref='parent', remote_side=[id], cascade="all, delete-orphan", single_parent=True)
-
-# Create tables if they don't exist
-Base.metadata.create_all(engine)
-
-# --- AnyTree Conversion Helpers ---
-def dict_to_tree(task_dict, parent=None):
-    """Recursively convert a task dict (with subtasks) to an anytree Node tree."""
-    node = Node(
-        None,
-        id=task_dict["id"],
-        title=task_dict["title"],
-        description=task_dict.get("description", ""),
-        deadline=task_dict.get("deadline"),
-        completed=task_dict.get("completed", False),
-        created_at=task_dict.get("created_at"),
-        how_to_guide=task_dict.get("how_to_guide", ""),
-        parent=parent
+    __table_args__ = (
+        Index("ix_tasks_ctx_parent", "context_id", "parent_id"),
+        Index("ix_tasks_parent", "parent_id"),
     )
-    for sub in task_dict.get("subtasks", []):
-        dict_to_tree(sub, parent=node)
-    return node
-
-def tree_to_dict(node):
-    """Recursively convert an anytree Node tree to a task dict (with subtasks)."""
-    d = {
-        "id": node.id,
-        "title": node.title,
-        "description": node.description,
-        "deadline": node.deadline,
-        "completed": node.completed,
-        "created_at": node.created_at,
-        "how_to_guide": node.how_to_guide,
-        "subtasks": [tree_to_dict(child) for child in node.children]
-    }
-    return d
 
-def load_tasks():
-    global tasks_by_context, contexts, next_id, default_context_id
+# --- Legacy tasks.json import ---
+# Tasks used to live in tasks.json as well as the database; an existing file is imported once
+LEGACY_TASKS_PATH = "tasks.json"
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def _ensure_default_context(session):
+    """Create the default context if the database doesn't have it yet."""
+    if session.get(Context, default_context_id) is None:
+        session.add(Context(
+            id=default_context_id,
+            name="Default",
+            description="Default context",
+            created_at=datetime.now()
+        ))
+
+def _parse_created_at(value: Optional[str]) -> datetime:
+    return datetime.fromisoformat(value) if value else datetime.now()
+
+def migrate_legacy_tasks(path: str = LEGACY_TASKS_PATH):
+    """
+    Import a tasks.json written by the old in-memory store into the database, then rename it to
+    tasks.json.migrated so the import only runs once.
+
+    Contexts keep their ids and are skipped if they already exist. Tasks get new ids, since the
+    JSON store numbered them independently of the database; they are inserted one tree level
+    at a time so every subtask can point at its parent's new id. A file that can't be read or
+    imported is logged and left in place, and the store starts without it.
+    """
+    if not os.path.exists(path):
+        return
     try:
-        if os.path.exists("tasks.json"):
-            with open("tasks.json", "r") as f:
-                old_tasks = json.load(f)
-            if isinstance(old_tasks, dict) and "contexts" in old_tasks:
-                contexts = old_tasks["contexts"]
-                # Convert dicts to Node trees
-                tasks_by_context = {
-                    ctx: [dict_to_tree(task) for task in task_list]
-                    for ctx, task_list in old_tasks["tasks_by_context"].items()
-                }
-                default_context_exists = any(c["id"] == default_context_id for c in contexts)
-                if not default_context_exists:
-                    contexts.append({
-                        "id": default_context_id,
-                        "name": "Default",
-                        "description": "Default context",
-                        "created_at": datetime.now().isoformat()
-                    })
-            else:
-                contexts = [{
-                    "id": default_context_id,
-                    "name": "Default",
-                    "description": "Default context",
-                    "created_at": datetime.now().isoformat()
-                }]
-                tasks_by_context = {default_context_id: [dict_to_tree(task) for task in old_tasks]}
-            # Find the highest ID
-            max_id = 0
-            for context_tasks in tasks_by_context.values():
-                for root in context_tasks:
-                    for node in PreOrderIter(root):
-                        max_id = max(max_id, getattr(node, "id", 0))
-            next_id = max_id + 1
-            save_tasks()
+        with open(path, "rb") as f:
+            data = _loads(f.read())
     except Exception as e:
-        print(f"Error loading tasks: {e}")
-        contexts = [{
-            "id": default_context_id,
-            "name": "Default",
-            "description": "Default context",
-            "created_at": datetime.now().isoformat()
-        }]
-        tasks_by_context = {default_context_id: []}
-        next_id = 1
-
-def get_max_id(task_list: List[Dict[str, Any]]) -> int:
-    """Recursively find the highest ID in the task tree."""
-    max_id = 0
-    for task in task_list:
-        max_id = max(max_id, task.get("id", 0))
-        if "subtasks" in task and task["subtasks"]:
-            subtask_max_id = get_max_id(task["subtasks"])
-            max_id = max(max_id, subtask_max_id)
-    return max_id
-
-def save_tasks():
+        logger.warning("Error loading %s, not importing it: %s", path, e)
+        return
     try:
-        with open("tasks.json", "w") as f:
-            json.dump({
-                "contexts": contexts,
-                "tasks_by_context": {
-                    ctx: [tree_to_dict(root) for root in task_list]
-                    for ctx, task_list in tasks_by_context.items()
-                }
-            }, f)
+        _import_legacy_data(data)
     except Exception as e:
-        print(f"Error saving tasks: {e}")
+        # Nothing was committed; leave the file in place so it can be fixed and imported on a later start
+        logger.warning("Error importing %s, leaving it in place: %s", path, e)
+        return
+    os.replace(path, path + ".migrated")
+
+def _import_legacy_data(data: Any):
+    """Insert the contexts and task trees of a loaded tasks.json in one transaction."""
+    if isinstance(data, list):
+        # The oldest format was a bare list of tasks in the default context
+        data = {"contexts": [], "tasks_by_context": {default_context_id: data}}
+    tasks_by_context = data.get("tasks_by_context", {})
+    with _transaction() as session:
+        known_contexts = {row.id for row in session.query(Context.id)}
+        legacy_contexts = {c["id"]: c for c in data.get("contexts", [])}
+        for context_id in {**legacy_contexts, **tasks_by_context}:
+            if context_id in known_contexts:
+                continue
+            context = legacy_contexts.get(context_id, {})
+            session.add(Context(
+                id=context_id,
+                name=context.get("name") or context_id,
+                description=context.get("description") or "",
+                created_at=_parse_created_at(context.get("created_at"))
+            ))
+        # (legacy task dict, context id, new parent id) for the level being inserted
+        level = [(task, ctx, None) for ctx, task_list in tasks_by_context.items() for task in task_list]
+        while level:
+            rows = [{
+                "title": task["title"],
+                "description": task.get("description") or "",
+                "deadline": task.get("deadline"),
+                "completed": bool(task.get("completed", False)),
+                "created_at": _parse_created_at(task.get("created_at")),
+                "how_to_guide": task.get("how_to_guide") or "",
+                "context_id": ctx,
+                "parent_id": parent_id
+            } for task, ctx, parent_id in level]
+            ids = session.scalars(insert(Task).returning(Task.id, sort_by_parameter_order=True), rows).all()
+            level = [
+                (subtask, ctx, new_id)
+                for (task, ctx, _), new_id in zip(level, ids)
+                for subtask in task.get("subtasks") or ()
+            ]
 
 def create_context(name: str, description: str = "") -> Dict[str, Any]:
     """
     Create a new context session using SQLAlchemy.
     """
-    session = SessionLocal()
-    context_id = str(uuid.uuid4())
-    now = datetime.now()
     new_context = Context(
-        id=context_id,
+        id=str(uuid.uuid4()),
         name=name,
-        description=description,
-        created_at=now
+        description=description or "",
+        created_at=datetime.now()
     )
-    session.add(new_context)
-    session.commit()
-    session.refresh(new_context)
-    session.close()
+    with session_scope() as session:
+        session.add(new_context)
     return {
         "id": new_context.id,
         "name": new_context.name,
@@ -177,19 +220,16 @@ def get_contexts() -> List[Dict[str, Any]]:
     """
     Get all available contexts from the database.
     """
-    session = SessionLocal()
-    contexts = session.query(Context).all()
-    result = [
-        {
-            "id": c.id,
-            "name": c.name,
-            "description": c.description,
-            "created_at": c.created_at.isoformat()
-        }
-        for c in contexts
-    ]
-    session.close()
-    return result
+    with session_scope() as session:
+        return [
+            {
+                "id": c.id,
+                "name": c.name,
+                "description": c.description,
+                "created_at": c.created_at.isoformat()
+            }
+            for c in session.query(Context).all()
+        ]
 
 def delete_context(context_id: str) -> Dict[str, Any]:
     """
@@ -201,89 +241,244 @@ def delete_context(context_id: str) -> Dict[str, Any]:
     Returns:
         Success or error message
     """
-    global contexts, tasks_by_context
-    
     # Cannot delete the default context
     if context_id == default_context_id:
         return {"error": "Cannot delete the default context"}
-    
-    # Find the context
-    context_index = None
-    for i, context in enumerate(contexts):
-        if context["id"] == context_id:
-            context_index = i
-            break
-    
-    if context_index is None:
-        return {"error": f"Context with ID {context_id} not found"}
-    
-    # Remove the context and its tasks
-    removed_context = contexts.pop(context_index)
-    if context_id in tasks_by_context:
-        del tasks_by_context[context_id]
-    
-    save_tasks()
-    return {"success": True, "message": f"Context '{removed_context['name']}' deleted"}
+    with session_scope() as session:
+        context = session.get(Context, context_id)
+        if not context:
+            return {"error": f"Context with ID {context_id} not found"}
+        # Plain DELETEs, so the ORM cascade doesn't load every task in the context first
+        session.execute(delete(Task.__table__).where(Task.__table__.c.context_id == context_id))
+        session.execute(delete(Context.__table__).where(Context.__table__.c.id == context_id))
+    return {"success": True, "message": f"Context '{context.name}' deleted"}
 
 def add_task(title: str, description: str = "", deadline: str = None, parent_id: int = None, context_id: str = default_context_id, how_to_guide: str = "") -> Dict[str, Any]:
     """
     Add a new task, either as a root task or as a subtask of another task, using SQLAlchemy.
     """
-    session = SessionLocal()
+    with session_scope() as session:
+        # Check context exists
+        context = session.get(Context, context_id)
+        if not context:
+            return {"error": f"Context with ID {context_id} not found"}
+        # If parent_id is provided, check parent exists
+        if parent_id is not None:
+            parent = session.get(Task, parent_id)
+            if not parent or parent.context_id != context_id:
+                return {"error": f"Parent task with ID {parent_id} not found in context {context_id}"}
+        new_task = Task(
+            title=title,
+            description=description or "",
+            deadline=deadline,
+            completed=False,
+            created_at=datetime.now(),
+            how_to_guide=how_to_guide or "",
+            context_id=context_id,
+            parent_id=parent_id
+        )
+        session.add(new_task)
+        # The INSERT reports the new id; a new task has no subtasks, so there is nothing to read back
+        session.flush()
+        return {
+            "id": new_task.id,
+            "title": new_task.title,
+            "description": new_task.description,
+            "deadline": new_task.deadline,
+            "completed": False,
+            "created_at": new_task.created_at.isoformat(),
+            "how_to_guide": new_task.how_to_guide,
+            "subtasks": []
+        }
+
+def _task_fields_error(task: Dict[str, Any]) -> Optional[str]:
+    """
+    Check the types of a task item's fields, so that one bad value is reported for its own item
+    instead of failing the multi-row INSERT for the whole batch.
+    """
+    title = task.get("title")
+    if not isinstance(title, str) or not title:
+        return "title must be a non-empty string"
+    for field in ("description", "deadline", "how_to_guide", "context_id"):
+        if task.get(field) is not None and not isinstance(task[field], str):
+            return f"{field} must be a string"
+    parent_id = task.get("parent_id")
+    if parent_id is not None and (not isinstance(parent_id, int) or isinstance(parent_id, bool)):
+        return "parent_id must be an integer"
+    return None
+
+def add_tasks_bulk(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Add several tasks with a single multi-row INSERT, using SQLAlchemy.
+
+    Each item takes add_task's arguments as keys (title is required). Field types, contexts and
+    parents are validated for the whole batch up front; items that fail get an error dict in
+    their slot and the rest are still inserted. Parents must already exist, not be created in
+    the same batch.
+    """
     now = datetime.now()
-    # Check context exists
-    context = session.query(Context).filter_by(id=context_id).first()
-    if not context:
-        session.close()
-        return {"error": f"Context with ID {context_id} not found"}
-    # If parent_id is provided, check parent exists
-    parent = None
-    if parent_id is not None:
-        parent = session.query(Task).filter_by(id=parent_id, context_id=context_id).first()
-        if not parent:
-            session.close()
-            return {"error": f"Parent task with ID {parent_id} not found in context {context_id}"}
-    new_task = Task(
-        title=title,
-        description=description or "",
-        deadline=deadline,
-        completed=False,
-        created_at=now,
-        how_to_guide=how_to_guide or "",
-        context_id=context_id,
-        parent_id=parent_id
-    )
-    session.add(new_task)
-    session.commit()
-    session.refresh(new_task)
-    task_dict = task_to_dict(new_task, session)
-    session.close()
-    return task_dict
+    results: List[Dict[str, Any]] = []
+    rows: List[Dict[str, Any]] = []
+    field_errors = [_task_fields_error(task) for task in tasks]
+    valid = [task for task, error in zip(tasks, field_errors) if error is None]
+    with session_scope() as session:
+        context_ids = {task.get("context_id", default_context_id) for task in valid}
+        known_contexts = {row.id for row in session.query(Context.id).filter(Context.id.in_(context_ids))}
+        parent_ids = {task["parent_id"] for task in valid if task.get("parent_id") is not None}
+        parent_contexts = dict(session.query(Task.id, Task.context_id).filter(Task.id.in_(parent_ids)).all()) if parent_ids else {}
+        for task, error in zip(tasks, field_errors):
+            context_id = task.get("context_id", default_context_id)
+            parent_id = task.get("parent_id")
+            if error is not None:
+                results.append({"error": error})
+            elif context_id not in known_contexts:
+                results.append({"error": f"Context with ID {context_id} not found"})
+            elif parent_id is not None and parent_contexts.get(parent_id) != context_id:
+                results.append({"error": f"Parent task with ID {parent_id} not found in context {context_id}"})
+            else:
+                row = {
+                    "title": task["title"],
+                    "description": task.get("description") or "",
+                    "deadline": task.get("deadline"),
+                    "completed": False,
+                    "created_at": now,
+                    "how_to_guide": task.get("how_to_guide") or "",
+                    "context_id": context_id,
+                    "parent_id": parent_id
+                }
+                results.append(row)
+                rows.append(row)
+        if rows:
+            ids = session.scalars(insert(Task).returning(Task.id, sort_by_parameter_order=True), rows).all()
+            for row, new_id in zip(rows, ids):
+                row["id"] = new_id
+    return [result if "error" in result else {
+        "id": result["id"],
+        "title": result["title"],
+        "description": result["description"],
+        "deadline": result["deadline"],
+        "completed": False,
+        "created_at": now.isoformat(),
+        "how_to_guide": result["how_to_guide"],
+        "subtasks": []
+    } for result in results]
 
 def get_tasks(context_id: str = default_context_id) -> List[Dict[str, Any]]:
     """
     Get all root tasks from a specific context using SQLAlchemy.
     """
-    session = SessionLocal()
-    tasks = session.query(Task).filter_by(context_id=context_id, parent_id=None).all()
-    result = [task_to_dict(task, session) for task in tasks]
-    session.close()
-    return result
+    with session_scope() as session:
+        root_ids = session.scalars(_ROOT_IDS, {"context_id": context_id}).all()
+        return tasks_to_dicts(root_ids, session)
+
+# --- Prebuilt statements ---
+# Built once with bind parameters: constructing a recursive CTE expression costs more Python
+# time than SQLite takes to run it, and executing a prebuilt statement reuses its compiled SQL.
+_tasks = Task.__table__
+
+def _subtree_cte(bounded: bool):
+    """
+    Recursive CTE over the tasks in :root_ids and their descendants, with each row's level below
+    its root. The bounded variant stops one level past :depth, which is enough to tell whether a
+    task at the cut-off has subtasks.
+    """
+    anchor = select(_tasks, literal(0).label("level")).where(_tasks.c.id.in_(bindparam("root_ids", expanding=True)))
+    subtree = anchor.cte("subtree", recursive=True)
+    step = select(_tasks, (subtree.c.level + 1).label("level")).join(subtree, _tasks.c.parent_id == subtree.c.id)
+    if bounded:
+        step = step.where(subtree.c.level <= bindparam("depth"))
+    return subtree.union_all(step)
+
+def _select_subtree_rows(subtree):
+    """
+    Select a subtree's rows as plain tuples, in the column order tasks_to_dicts unpacks.
+    created_at comes back as the stored text rather than being parsed into a datetime, since
+    tasks_to_dicts only turns it back into a string.
+    """
+    c = subtree.c
+    return select(
+        c.id, c.title, c.description, c.deadline, c.completed, type_coerce(c.created_at, String),
+        c.how_to_guide, c.parent_id, c.level
+    ).order_by(c.id)
+
+def _ancestor_check():
+    """Select :ancestor_id if it is :task_id or one of its ancestors, walking the parent chain."""
+    chain = select(_tasks.c.id, _tasks.c.parent_id).where(_tasks.c.id == bindparam("task_id")).cte("chain", recursive=True)
+    chain = chain.union_all(select(_tasks.c.id, _tasks.c.parent_id).join(chain, _tasks.c.id == chain.c.parent_id))
+    return select(chain.c.id).where(chain.c.id == bindparam("ancestor_id")).limit(1)
+
+_SUBTREE = _subtree_cte(bounded=False)
+_SUBTREE_IDS = select(_SUBTREE.c.id)
+_SELECT_SUBTREE = _select_subtree_rows(_SUBTREE)
+_SELECT_SUBTREE_TO_DEPTH = _select_subtree_rows(_subtree_cte(bounded=True))
+_SET_SUBTREE_COMPLETED = update(_tasks).where(_tasks.c.id.in_(_SUBTREE_IDS)).values(completed=bindparam("new_completed"))
+_SET_SUBTREE_CONTEXT = update(_tasks).where(_tasks.c.id.in_(_SUBTREE_IDS)).values(context_id=bindparam("new_context_id"))
+_DELETE_SUBTREE = delete(_tasks).where(_tasks.c.id.in_(_SUBTREE_IDS))
+_ROOT_IDS = select(_tasks.c.id).where(_tasks.c.context_id == bindparam("context_id"), _tasks.c.parent_id.is_(None))
+_IS_ANCESTOR_OR_SELF = _ancestor_check()
+
+def _fetch_subtree_rows(session, root_ids: List[int], depth: Optional[int] = None) -> List[Any]:
+    """
+    Fetch the given tasks and their descendants with a single recursive CTE.
+    """
+    if depth is None:
+        return session.execute(_SELECT_SUBTREE, {"root_ids": root_ids}).all()
+    return session.execute(_SELECT_SUBTREE_TO_DEPTH, {"root_ids": root_ids, "depth": depth}).all()
+
+def _is_ancestor_or_self(session, ancestor_id: int, task_id: int) -> bool:
+    """
+    Check whether ancestor_id is task_id or one of its ancestors with a single recursive CTE.
+    """
+    return session.execute(_IS_ANCESTOR_OR_SELF, {"task_id": task_id, "ancestor_id": ancestor_id}).first() is not None
+
+def _stored_to_iso(value: str) -> str:
+    """
+    Turn a DateTime as SQLAlchemy stores it in SQLite ('YYYY-MM-DD HH:MM:SS.ffffff') into the
+    string datetime.isoformat() gives for it, without building a datetime in between.
+    """
+    return value.replace(" ", "T", 1).removesuffix(".000000")
+
+def tasks_to_dicts(root_ids: List[int], session, depth: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Convert the given tasks to dicts with their subtask hierarchies, in root_ids order.
+    The subtrees are loaded in one query and assembled in memory. With depth set, subtasks more
+    than depth levels down are cut off and reported as None.
+    """
+    if not root_ids:
+        return []
+    rows = _fetch_subtree_rows(session, root_ids, depth)
+    # Build every dict first, then link each one into its parent's subtasks in a second pass:
+    # ids only follow creation order, so a moved task can come before its new parent. Unpacking
+    # the row tuples is several times faster than attribute access on SQLAlchemy rows.
+    by_id: Dict[int, Dict[str, Any]] = {}
+    links = []
+    for id, title, description, deadline, completed, created_at, how_to_guide, parent_id, level in rows:
+        by_id[id] = {
+            "id": id,
+            "title": title,
+            "description": description,
+            "deadline": deadline,
+            "completed": completed,
+            "created_at": _stored_to_iso(created_at) if created_at else None,
+            "how_to_guide": how_to_guide,
+            "subtasks": []
+        }
+        if level:
+            links.append((id, parent_id, level))
+    for id, parent_id, level in links:
+        parent = by_id[parent_id]
+        if depth is not None and level > depth:
+            # Only fetched to show that the task at the cut-off has subtasks
+            parent["subtasks"] = None
+        else:
+            parent["subtasks"].append(by_id[id])
+    return [by_id[root_id] for root_id in root_ids if root_id in by_id]
 
 def task_to_dict(task, session):
     """
-    Recursively convert a Task SQLAlchemy object to a dict with subtasks.
+    Convert a Task SQLAlchemy object to a dict with its full subtask hierarchy.
     """
-    return {
-        "id": task.id,
-        "title": task.title,
-        "description": task.description,
-        "deadline": task.deadline,
-        "completed": task.completed,
-        "created_at": task.created_at.isoformat() if task.created_at else None,
-        "how_to_guide": task.how_to_guide,
-        "subtasks": [task_to_dict(sub, session) for sub in session.query(Task).filter_by(parent_id=task.id).all()]
-    }
+    return tasks_to_dicts([task.id], session)[0]
 
 def update_subtree(id: int, title: Optional[str] = None, description: Optional[str] = None, 
                   deadline: Optional[str] = None, completed: Optional[bool] = None,
@@ -291,38 +486,34 @@ def update_subtree(id: int, title: Optional[str] = None, description: Optional[s
     """
     Update a task's properties while preserving its subtasks, using SQLAlchemy.
     """
-    session = SessionLocal()
-    task = session.query(Task).filter_by(id=id).first()
-    if not task:
-        session.close()
-        return {"error": f"Task with ID {id} not found"}
-    if title is not None:
-        task.title = title
-    if description is not None:
-        task.description = description
-    if deadline is not None:
-        task.deadline = deadline
-    if completed is not None:
-        task.completed = completed
-    if how_to_guide is not None:
-        task.how_to_guide = how_to_guide
-    session.commit()
-    task_dict = task_to_dict(task, session)
-    session.close()
-    return task_dict
+    with session_scope() as session:
+        task = session.get(Task, id)
+        if not task:
+            return {"error": f"Task with ID {id} not found"}
+        if title is not None:
+            task.title = title
+        if description is not None:
+            task.description = description
+        if deadline is not None:
+            task.deadline = deadline
+        if completed is not None:
+            task.completed = completed
+        if how_to_guide is not None:
+            task.how_to_guide = how_to_guide
+        session.flush()
+        return task_to_dict(task, session)
 
 def delete_task(id: int, context_id: Optional[str] = None) -> Dict[str, Any]:
     """
-    Delete a task by ID (and its subtasks via cascade) using SQLAlchemy.
+    Delete a task by ID and all of its subtasks using SQLAlchemy.
     """
-    session = SessionLocal()
-    task = session.query(Task).filter_by(id=id).first()
-    if not task:
-        session.close()
-        return {"error": f"Task with ID {id} not found"}
-    session.delete(task)
-    session.commit()
-    session.close()
+    with session_scope() as session:
+        task = session.get(Task, id)
+        if not task:
+            return {"error": f"Task with ID {id} not found"}
+        # One DELETE over the subtree CTE; deleting through the ORM would load the task's
+        # subtasks only to detach them into root tasks
+        session.execute(_DELETE_SUBTREE, {"root_ids": [id]})
     return {"success": True, "message": f"Task '{task.title}' deleted"}
 
 def move_subtree(id: int, new_parent_id: Optional[int] = None, 
@@ -330,71 +521,37 @@ def move_subtree(id: int, new_parent_id: Optional[int] = None,
     """
     Move a task and all its subtasks to a new parent or to the root level, optionally between contexts, using SQLAlchemy.
     """
-    session = SessionLocal()
-    task = session.query(Task).filter_by(id=id).first()
-    if not task:
-        session.close()
-        return {"error": f"Task with ID {id} not found"}
-    if new_parent_id == id:
-        session.close()
-        return {"error": "Cannot move a task to be its own child"}
-    if target_context_id:
-        context = session.query(Context).filter_by(id=target_context_id).first()
-        if not context:
-            session.close()
-            return {"error": f"Target context with ID {target_context_id} not found"}
-        task.context_id = target_context_id
-    if new_parent_id:
-        parent = session.query(Task).filter_by(id=new_parent_id).first()
-        if not parent:
-            session.close()
-            return {"error": f"Parent task with ID {new_parent_id} not found"}
-        # Prevent cycles
-        def is_descendant(child_id, ancestor_id):
-            if child_id == ancestor_id:
-                return True
-            child = session.query(Task).filter_by(id=child_id).first()
-            if child and child.parent_id:
-                return is_descendant(child.parent_id, ancestor_id)
-            return False
-        if is_descendant(new_parent_id, id):
-            session.close()
-            return {"error": "Cannot move a task to be a child of its own descendant"}
-        task.parent_id = new_parent_id
-    else:
-        task.parent_id = None
-    session.commit()
-    task_dict = task_to_dict(task, session)
-    session.close()
-    return task_dict
-
-def add_subtask(task_list: List[Node], parent_id: int, subtask: Node) -> bool:
-    """Recursively search for a parent task and add the subtask to it."""
-    for task in task_list:
-        if task.id == parent_id:
-            subtask.parent = task
-            return True
-        if task.children:
-            if add_subtask(task.children, parent_id, subtask):
-                return True
-    return False
-
-def find_task(task_list: List[Node], id: int) -> Optional[Node]:
-    """Find a task by its ID using anytree's PreOrderIter for all roots."""
-    for root in task_list:
-        for node in PreOrderIter(root):
-            if node.id == id:
-                return node
-    return None
-
-def find_task_context(id: int) -> Optional[str]:
-    """Find which context a task belongs to using anytree's PreOrderIter."""
-    for context_id, tasks in tasks_by_context.items():
-        for root in tasks:
-            for node in PreOrderIter(root):
-                if node.id == id:
-                    return context_id
-    return None
+    with session_scope() as session:
+        task = session.get(Task, id)
+        if not task:
+            return {"error": f"Task with ID {id} not found"}
+        if new_parent_id == id:
+            return {"error": "Cannot move a task to be its own child"}
+        # Validate everything before changing the task, since the session commits on the way out
+        if target_context_id:
+            context = session.get(Context, target_context_id)
+            if not context:
+                return {"error": f"Target context with ID {target_context_id} not found"}
+        context_id = target_context_id or task.context_id
+        if new_parent_id:
+            parent = session.get(Task, new_parent_id)
+            if not parent:
+                return {"error": f"Parent task with ID {new_parent_id} not found"}
+            if target_context_id and parent.context_id != target_context_id:
+                return {"error": f"Parent task with ID {new_parent_id} not found in context {target_context_id}"}
+            context_id = parent.context_id
+            # Prevent cycles
+            if _is_ancestor_or_self(session, id, new_parent_id):
+                return {"error": "Cannot move a task to be a child of its own descendant"}
+        # Reparenting is a single row update; the subtasks come along through their parent_id
+        moved_context = context_id != task.context_id
+        task.parent_id = new_parent_id or None
+        task.context_id = context_id
+        session.flush()
+        if moved_context:
+            # The subtasks follow the task into its new context
+            session.execute(_SET_SUBTREE_CONTEXT, {"root_ids": [id], "new_context_id": context_id})
+        return task_to_dict(task, session)
 
 def toggle_task(id: int, recursive: bool = False, context_id: Optional[str] = None) -> Union[Dict[str, Any], Dict[str, str]]:
     """
@@ -408,78 +565,49 @@ def toggle_task(id: int, recursive: bool = False, context_id: Optional[str] = No
     Returns:
         The modified task or an error message
     """
-    if context_id:
-        err = get_context_or_error(context_id)
-        if err:
-            return err
-        task = get_task_or_error(tasks_by_context[context_id], id, context_id)
-        if isinstance(task, dict):
-            return task
-    else:
-        context_id = find_task_context(id)
-        if not context_id:
-            return error_dict(f"Task with ID {id} not found in any context")
-        task = get_task_or_error(tasks_by_context[context_id], id, context_id)
+    with session_scope() as session:
+        task = get_task_or_error(session, id, context_id)
         if isinstance(task, dict):
             return task
-    task.completed = not task.completed
-    if recursive and task.children:
-        toggle_subtasks(task.children, task.completed)
-    save_tasks()
-    return tree_to_dict(task)
+        task.completed = not task.completed
+        session.flush()
+        if recursive:
+            session.execute(_SET_SUBTREE_COMPLETED, {"root_ids": [id], "new_completed": task.completed})
+        return task_to_dict(task, session)
 
-def toggle_subtasks(subtasks: List[Node], completed: bool):
-    """Recursively toggle all subtasks using anytree's PreOrderIter."""
-    for subtask in subtasks:
-        for node in PreOrderIter(subtask):
-            node.completed = completed
-
-def get_subtree(id: int, context_id: Optional[str] = None) -> Union[Dict[str, Any], Dict[str, str]]:
+def get_subtree(id: int, context_id: Optional[str] = None, depth: Optional[int] = None) -> Union[Dict[str, Any], Dict[str, str]]:
     """
     Get a specific task and all its subtasks by ID.
     
     Args:
         id: The ID of the task to retrieve
         context_id: If provided, only search in this context
+        depth: If provided (0 or greater), only include subtasks up to this many levels below the task
         
     Returns:
         The task subtree or an error message
     """
-    if context_id:
-        err = get_context_or_error(context_id)
-        if err:
-            return err
-        task = get_task_or_error(tasks_by_context[context_id], id, context_id)
-        if isinstance(task, dict):
-            return task
-    else:
-        context_id = find_task_context(id)
-        if not context_id:
-            return error_dict(f"Task with ID {id} not found in any context")
-        task = get_task_or_error(tasks_by_context[context_id], id, context_id)
+    if depth is not None and depth < 0:
+        return {"error": f"depth must be 0 or greater, got {depth}"}
+    with session_scope() as session:
+        task = get_task_or_error(session, id, context_id)
         if isinstance(task, dict):
             return task
-    return deepcopy(tree_to_dict(task))
-
-def find_parent_of_task(task_list: List[Node], id: int) -> Optional[Node]:
-    """Find the parent of a task by the task's ID using anytree's .parent attribute."""
-    node = find_task(task_list, id)
-    return node.parent if node else None
+        return tasks_to_dicts([task.id], session, depth)[0]
 
 # --- Simplification Helpers ---
 def error_dict(msg: str) -> Dict[str, str]:
     return {"error": msg}
 
-def get_context_or_error(context_id: str) -> Optional[Dict[str, Any]]:
-    if context_id not in tasks_by_context:
+def get_task_or_error(session, id: int, context_id: Optional[str] = None) -> Union[Task, Dict[str, str]]:
+    """Load a task, from the given context if there is one, or return the error to report."""
+    task = session.get(Task, id)
+    if not context_id:
+        return task or error_dict(f"Task with ID {id} not found in any context")
+    if task is not None and task.context_id == context_id:
+        return task
+    # Only a miss needs the context lookup, to tell which error to report
+    if session.get(Context, context_id) is None:
         return error_dict(f"Context with ID {context_id} not found")
-    return None
-
-def get_task_or_error(task_list: List[Node], id: int, context_id: str) -> Union[Node, Dict[str, str]]:
-    task = find_task(task_list, id)
-    if not task:
-        return error_dict(f"Task with ID {id} not found in context {context_id}")
-    return task
+    return error_dict(f"Task with ID {id} not found in context {context_id}")
 
-# Load tasks on import
-load_tasks()